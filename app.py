@@ -1,36 +1,71 @@
-from datetime import datetime
+import atexit
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import os
+import re
 import subprocess
 import platform
+import threading
 import time
 import logging
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, request
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import psutil
 import pynvml
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; keep production runs quiet so the hot path pays
+# nothing for diagnostic output
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # Constants
 TEGRASTATS_INTERVAL = 1000
+CPU_SAMPLE_INTERVAL = 1.0
+METRICS_CACHE_TTL = 0.5
+SSE_PUSH_INTERVAL = 1.0
+SSE_HEARTBEAT_INTERVAL = 15.0
+THROTTLE_CACHE_TTL = 1.0
+DISK_CACHE_TTL = 5.0
 MEMORY_PRESSURE_WEIGHTS = {
     'memory_usage': 0.7,
     'swap_usage': 0.2,
     'available': 0.1
 }
+# Hoisted weights so calculate_memory_pressure avoids per-call dict lookups
+_W_MEM = MEMORY_PRESSURE_WEIGHTS['memory_usage']
+_W_SWAP = MEMORY_PRESSURE_WEIGHTS['swap_usage']
+_W_AVAIL = MEMORY_PRESSURE_WEIGHTS['available']
 LOW_MEMORY_THRESHOLD = 50
 LOW_SWAP_THRESHOLD = 20
 MAX_PRESSURE_CAP = 50
 BYTES_PER_MB = 1024 * 1024
 BYTES_PER_KB = 1024
+BYTES_PER_GB = BYTES_PER_MB * 1024
 SECONDS_PER_HOUR = 3600
 SECONDS_PER_MINUTE = 60
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, static_folder='static')
+app.json = OrjsonProvider(app)
 
+@functools.lru_cache(maxsize=1)
 def is_jetson():
-    """Check if the system is a Jetson device."""
+    """Check if the system is a Jetson device.
+
+    The result is cached since the hardware platform never changes at
+    runtime, so repeated calls avoid re-reading /proc/device-tree/model.
+    """
     try:
         with open('/proc/device-tree/model', 'r') as f:
             model = f.read().lower()
@@ -38,99 +73,227 @@ def is_jetson():
     except (FileNotFoundError, PermissionError, OSError):
         return False
 
+# One alternation pattern extracts every tegrastats field in a single scan;
+# the fields appear in version-dependent order, so each branch is independent.
+_TEGRA_RE = re.compile(
+    r'RAM (?P<ram_used>\d+)/(?P<ram_total>\d+)MB'
+    r'|GR3D_FREQ (?P<gpu_util>[\d.]+)%'
+    r'|cpu@(?P<cpu_temp>[\d.]+)C'
+    r'|gpu@(?P<gpu_temp>[\d.]+)C'
+    r'|VDD_IN (?P<total_power>[\d.]+)mW'
+    r'|VDD_CPU_GPU_CV (?P<gpu_power>[\d.]+)mW'
+)
+
+# Shared state for the background tegrastats reader; each line is parsed
+# once at the tegrastats cadence rather than once per consumer
+_tegrastats_lock = threading.Lock()
+_tegrastats_process = None
+_tegrastats_cache = {'line': '', 'metrics': {}}
+
+def _tegrastats_reader(process):
+    """Continuously read and parse tegrastats output into the shared cache."""
+    for line in process.stdout:
+        line = line.strip()
+        metrics = parse_tegrastats_line(line)
+        with _tegrastats_lock:
+            _tegrastats_cache['line'] = line
+            _tegrastats_cache['metrics'] = metrics
+
+def start_tegrastats_reader():
+    """Start tegrastats once and keep reading its output in a daemon thread.
+
+    Spawning tegrastats on every request pays fork/exec plus tegrastats
+    startup latency; a single long-lived process amortizes that cost and
+    request handlers just read the cached line.
+    """
+    global _tegrastats_process
+    if _tegrastats_process is not None:
+        return
+    try:
+        # stderr goes to DEVNULL: nothing drains it, so a PIPE could fill
+        # up and block tegrastats. Line buffering keeps one read per line.
+        _tegrastats_process = subprocess.Popen(
+            ['tegrastats', '--interval', str(TEGRASTATS_INTERVAL)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+    except (subprocess.SubprocessError, OSError) as e:
+        logger.error("Could not start tegrastats: %s", str(e))
+        return
+    atexit.register(_tegrastats_process.terminate)
+    threading.Thread(target=_tegrastats_reader,
+                     args=(_tegrastats_process,), daemon=True).start()
+
+def get_latest_tegrastats():
+    """Return the most recent tegrastats line read by the background reader."""
+    with _tegrastats_lock:
+        return _tegrastats_cache['line']
+
+# Platform identity never changes for the process lifetime
+_PLATFORM_INFO = {
+    'system': platform.system(),
+    'machine': platform.machine(),
+    'is_jetson': is_jetson()
+}
+
+# Compiled patterns for parse_tegrastats_value, keyed by (key, unit); each
+# unique field is compiled once instead of re-splitting strings per call
+_VALUE_PATTERNS = {}
+
 def parse_tegrastats_value(stats, key, unit=''):
     """Parse a value from tegrastats output."""
-    try:
-        if key in stats:
-            part = stats.split(key)[1].split(unit)[0].strip()
-            return float(part)
-    except (ValueError, IndexError):
-        logger.debug(f"Could not parse {key} value from tegrastats output")
+    pattern = _VALUE_PATTERNS.get((key, unit))
+    if pattern is None:
+        pattern = re.compile(
+            re.escape(key) + r'\s*([\d.]+)' + re.escape(unit))
+        _VALUE_PATTERNS[(key, unit)] = pattern
+    match = pattern.search(stats)
+    if match:
+        return float(match.group(1))
+    if key in stats:
+        logger.debug("Could not parse %s value from tegrastats output", key)
     return None
 
-def get_jetson_gpu_metrics():
-    """Get GPU metrics using tegrastats for Jetson devices."""
+def parse_tegrastats_line(stats):
+    """Parse one tegrastats output line into a metrics dict."""
+    logger.debug("Processing tegrastats line: %s", stats)
+
+    # Collect all fields in a single scan of the line
+    fields = {}
+    for match in _TEGRA_RE.finditer(stats):
+        for key, value in match.groupdict().items():
+            if value is not None:
+                fields[key] = value
+
+    metrics = {}
+
+    # GPU usage, temperatures and power rails
+    if 'gpu_util' in fields:
+        metrics['gpu_utilization'] = float(fields['gpu_util'])
+    if 'gpu_temp' in fields:
+        metrics['gpu_temperature'] = float(fields['gpu_temp'])
+    if 'cpu_temp' in fields:
+        metrics['cpu_temperature'] = float(fields['cpu_temp'])
+    if 'total_power' in fields:
+        metrics['total_power'] = float(fields['total_power'])
+    if 'gpu_power' in fields:
+        metrics['gpu_power'] = float(fields['gpu_power'])
+
+    # RAM information
+    if 'ram_used' in fields:
+        used = float(fields['ram_used'])
+        total = float(fields['ram_total'])
+        metrics['ram_used'] = used
+        metrics['ram_total'] = total
+        metrics['ram_percent'] = (used / total) * 100
+
+    return metrics
+
+def get_cpu_core_metrics():
+    """Get per-core CPU usage and frequency using psutil.
+
+    psutil provides these cheaply on Jetson and non-Jetson hosts alike,
+    so the tegrastats CPU-block parsing is no longer needed.
+    """
+    usages = psutil.cpu_percent(interval=None, percpu=True)
+    freqs = psutil.cpu_freq(percpu=True) or []
+    if len(freqs) != len(usages):
+        return [{'usage': usage, 'frequency': 0.0} for usage in usages]
+    return [{'usage': usage, 'frequency': freq.current}
+            for usage, freq in zip(usages, freqs)]
+
+# Jetson exposes temperatures and GPU load directly in sysfs; reading those
+# small files is cheaper than going through tegrastats and works even if the
+# tegrastats binary is missing. Paths are discovered once at startup and
+# tegrastats stays the fallback for fields sysfs does not cover (power rails).
+_GPU_LOAD_PATH = '/sys/devices/gpu.0/load'
+
+def _discover_thermal_zones():
+    """Map metric names to Jetson thermal zone temp files."""
+    zones = {}
     try:
-        # Use Popen to start tegrastats and pipe its output
-        tegrastats_process = subprocess.Popen(
-            ['tegrastats', '--interval', str(TEGRASTATS_INTERVAL)], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        # Read the first line of output
-        stats = tegrastats_process.stdout.readline().strip()
-        logger.debug("Processing tegrastats line: %s", stats)
-        
-        # Terminate the process
-        tegrastats_process.terminate()
-        tegrastats_process.wait(timeout=1)
-        
-        metrics = {}
-        
-        # Extract GR3D_FREQ (GPU usage)
-        gpu_util = parse_tegrastats_value(stats, 'GR3D_FREQ', '%')
-        if gpu_util is not None:
-            metrics['gpu_utilization'] = gpu_util
-        
-        # Extract temperatures
-        gpu_temp = parse_tegrastats_value(stats, 'gpu@', 'C')
-        if gpu_temp is not None:
-            metrics['gpu_temperature'] = gpu_temp
-        
-        cpu_temp = parse_tegrastats_value(stats, 'cpu@', 'C')
-        if cpu_temp is not None:
-            metrics['cpu_temperature'] = cpu_temp
-        
-        # Extract power information
-        total_power = parse_tegrastats_value(stats, 'VDD_IN', 'mW')
-        if total_power is not None:
-            metrics['total_power'] = total_power
-        
-        gpu_power = parse_tegrastats_value(stats, 'VDD_CPU_GPU_CV', 'mW')
-        if gpu_power is not None:
-            metrics['gpu_power'] = gpu_power
-        
-        # Extract RAM information
-        if 'RAM' in stats:
-            try:
-                ram_part = stats.split('RAM')[1].split('MB')[0].strip()
-                used, total = ram_part.split('/')
-                metrics['ram_used'] = float(used)
-                metrics['ram_total'] = float(total)
-                metrics['ram_percent'] = (float(used) / float(total)) * 100
-            except (ValueError, IndexError):
-                logger.debug("Could not parse RAM information from tegrastats")
-        
-        # Extract CPU usage for each core
-        if 'CPU [' in stats:
+        for entry in os.listdir('/sys/class/thermal'):
+            if not entry.startswith('thermal_zone'):
+                continue
+            base = os.path.join('/sys/class/thermal', entry)
             try:
-                cpu_part = stats.split('CPU [')[1].split(']')[0]
-                cpu_cores = []
-                for core in cpu_part.split(','):
-                    try:
-                        usage = float(core.split('@')[0].strip('%'))
-                        freq = float(core.split('@')[1])
-                        cpu_cores.append({'usage': usage, 'frequency': freq})
-                    except (ValueError, IndexError):
-                        continue
-                metrics['cpu_cores'] = cpu_cores
-            except (ValueError, IndexError):
-                logger.debug("Could not parse CPU information from tegrastats")
-        
-        return metrics
-            
-    except (subprocess.SubprocessError, ValueError) as e:
-        logger.error("Error getting Jetson GPU metrics: %s", str(e))
+                with open(os.path.join(base, 'type'), 'r') as f:
+                    zone_type = f.read().strip().lower()
+            except OSError:
+                continue
+            if 'gpu' in zone_type:
+                zones['gpu_temperature'] = os.path.join(base, 'temp')
+            elif 'cpu' in zone_type:
+                zones['cpu_temperature'] = os.path.join(base, 'temp')
+    except OSError:
+        pass
+    return zones
+
+_THERMAL_ZONE_FILES = _discover_thermal_zones() if is_jetson() else {}
+_SYSFS_GPU_LOAD = (_GPU_LOAD_PATH
+                   if is_jetson() and os.path.exists(_GPU_LOAD_PATH) else None)
+
+def _read_sysfs_metrics():
+    """Read temperatures and GPU load straight from sysfs where available."""
+    metrics = {}
+    for key, path in _THERMAL_ZONE_FILES.items():
+        try:
+            with open(path, 'rb') as f:
+                metrics[key] = int(f.read()) / 1000.0  # millidegrees C
+        except (OSError, ValueError):
+            pass
+    if _SYSFS_GPU_LOAD:
+        try:
+            with open(_SYSFS_GPU_LOAD, 'rb') as f:
+                metrics['gpu_utilization'] = int(f.read()) / 10.0  # tenths of a percent
+        except (OSError, ValueError):
+            pass
+    return metrics
+
+def get_jetson_gpu_metrics():
+    """Get GPU metrics for Jetson devices.
+
+    Temperatures and GPU load come straight from sysfs when those files
+    exist; the tegrastats reader's cache fills in the rest (power rails,
+    RAM) and serves as the fallback when sysfs is unavailable.
+    """
+    with _tegrastats_lock:
+        metrics = dict(_tegrastats_cache['metrics'])
+    metrics.update(_read_sysfs_metrics())
+    if not metrics:
         return {'error': 'Failed to get GPU metrics'}
+    return metrics
+
+@functools.lru_cache(maxsize=1)
+def _nvml_init():
+    """Initialize NVML once per process; returns True when it is available."""
+    try:
+        pynvml.nvmlInit()
+        return True
+    except pynvml.NVMLError:
+        return False
+
+def _nvml_shutdown():
+    try:
+        pynvml.nvmlShutdown()
+    except pynvml.NVMLError:
+        pass
+
+atexit.register(_nvml_shutdown)
+
+# Cached NVML device handle; stable for the process lifetime
+_nvml_handle = None
 
 def get_nvidia_gpu_metrics():
     """Get GPU metrics using NVML for standard NVIDIA GPUs."""
+    global _nvml_handle
     try:
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-        gpu_utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        if _nvml_handle is None:
+            _nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        info = pynvml.nvmlDeviceGetMemoryInfo(_nvml_handle)
+        gpu_utilization = pynvml.nvmlDeviceGetUtilizationRates(_nvml_handle)
         return {
             'gpu_utilization': gpu_utilization.gpu,
             'gpu_memory_percent': (info.used / info.total) * 100,
@@ -145,29 +308,20 @@ def get_gpu_metrics():
     """Get GPU metrics based on the platform."""
     if is_jetson():
         return get_jetson_gpu_metrics()
-    else:
-        try:
-            pynvml.nvmlInit()
-            return get_nvidia_gpu_metrics()
-        except pynvml.NVMLError:
-            return {'error': 'No NVIDIA GPU detected'}
+    if not _nvml_init():
+        return {'error': 'No NVIDIA GPU detected'}
+    return get_nvidia_gpu_metrics()
 
 def calculate_memory_pressure(memory, swap):
     """Calculate memory pressure score based on memory and swap usage."""
     # Calculate memory pressure score (0-100)
     # Factors: memory usage, swap usage, and available memory
-    memory_usage_component = memory.percent * MEMORY_PRESSURE_WEIGHTS['memory_usage']
-    swap_component = swap.percent * MEMORY_PRESSURE_WEIGHTS['swap_usage']
-    available_component = (100 - (memory.available / memory.total * 100)) * MEMORY_PRESSURE_WEIGHTS['available']
-    
-    logger.debug("Memory pressure components: Memory=%.1f, Swap=%.1f, Available=%.1f",
-                memory_usage_component, swap_component, available_component)
-    
-    memory_pressure = memory_usage_component + swap_component + available_component
-    
-    # Cap the pressure at 100 and ensure it's not negative
-    memory_pressure = min(100, max(0, memory_pressure))
-    
+    # Single capped expression using the hoisted weight constants
+    memory_pressure = min(100.0, max(0.0,
+        memory.percent * _W_MEM
+        + swap.percent * _W_SWAP
+        + (100 - (memory.available / memory.total * 100)) * _W_AVAIL))
+
     # If memory usage is low (< 50%) and swap usage is low (< 20%), 
     # cap the pressure at 50 to better reflect system state
     if memory.percent < LOW_MEMORY_THRESHOLD and swap.percent < LOW_SWAP_THRESHOLD:
@@ -177,18 +331,25 @@ def calculate_memory_pressure(memory, swap):
     logger.debug("Final pressure score: %.1f", memory_pressure)
     return round(memory_pressure, 1)
 
-def get_memory_pressure_metrics():
-    """Get memory pressure and swap metrics."""
+def get_memory_pressure_metrics(memory=None, swap=None):
+    """Get memory pressure and swap metrics.
+
+    Callers that already hold psutil memory/swap readings can pass them in
+    to avoid a second /proc/meminfo parse.
+    """
     try:
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        
+        if memory is None:
+            memory = psutil.virtual_memory()
+        if swap is None:
+            swap = psutil.swap_memory()
+
         # Debug logging
-        logger.debug("Memory: %.1f%% used, %.1f MB available", 
-                    memory.percent, memory.available / BYTES_PER_MB)
-        logger.debug("Swap: %.1f%% used, %.1f MB used", 
-                    swap.percent, swap.used / BYTES_PER_MB)
-        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Memory: %.1f%% used, %.1f MB available",
+                        memory.percent, memory.available / BYTES_PER_MB)
+            logger.debug("Swap: %.1f%% used, %.1f MB used",
+                        swap.percent, swap.used / BYTES_PER_MB)
+
         memory_pressure = calculate_memory_pressure(memory, swap)
         
         return {
@@ -205,7 +366,7 @@ def get_memory_pressure_metrics():
                 'percent': memory.percent
             }
         }
-    except Exception as e:
+    except (OSError, ValueError, psutil.Error) as e:
         logger.error("Error getting memory pressure metrics: %s", str(e))
         return {
             'memory_pressure': 0,
@@ -213,21 +374,16 @@ def get_memory_pressure_metrics():
             'memory': {'available': 0, 'total': 0, 'percent': 0}
         }
 
+# Cached non-Jetson throttle status; the sysfs counter changes slowly
+_throttle_cache = {'ts': 0.0, 'status': None}
+
 def get_thermal_throttling_status():
     """Get thermal throttling status for CPU and GPU."""
     try:
-        # For Jetson devices, we can get this from tegrastats
+        # For Jetson devices, we can get this from the cached tegrastats output
         if is_jetson():
-            tegrastats_process = subprocess.Popen(
-                ['tegrastats', '--interval', str(TEGRASTATS_INTERVAL)], 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stats = tegrastats_process.stdout.readline().strip()
-            tegrastats_process.terminate()
-            tegrastats_process.wait(timeout=1)
-            
+            stats = get_latest_tegrastats()
+
             # Check for thermal throttling indicators in tegrastats output
             cpu_throttled = 'CPU_THROTTLE' in stats
             gpu_throttled = 'GPU_THROTTLE' in stats
@@ -238,22 +394,30 @@ def get_thermal_throttling_status():
                 'status': 'Throttled' if (cpu_throttled or gpu_throttled) else 'Normal'
             }
         else:
-            # For non-Jetson systems, we can check CPU thermal throttling
+            # For non-Jetson systems, we can check CPU thermal throttling;
+            # re-read the sysfs counter at most once per THROTTLE_CACHE_TTL
+            now = time.monotonic()
+            if (_throttle_cache['status'] is not None
+                    and now - _throttle_cache['ts'] < THROTTLE_CACHE_TTL):
+                return _throttle_cache['status']
             try:
                 with open('/sys/devices/system/cpu/cpu0/thermal_throttle/core_throttle_count', 'r') as f:
                     throttle_count = int(f.read().strip())
-                return {
+                status = {
                     'cpu_throttled': throttle_count > 0,
                     'gpu_throttled': False,  # We don't have GPU throttling info for non-Jetson
                     'status': 'Throttled' if throttle_count > 0 else 'Normal'
                 }
             except (FileNotFoundError, PermissionError, ValueError):
-                return {
+                status = {
                     'cpu_throttled': False,
                     'gpu_throttled': False,
                     'status': 'Unknown'
                 }
-    except Exception as e:
+            _throttle_cache['status'] = status
+            _throttle_cache['ts'] = now
+            return status
+    except (OSError, ValueError, psutil.Error) as e:
         logger.error("Error getting thermal throttling status: %s", str(e))
         return {
             'cpu_throttled': False,
@@ -263,8 +427,8 @@ def get_thermal_throttling_status():
 
 def format_bytes(bytes_value):
     """Format bytes into human readable format with appropriate units."""
-    if bytes_value >= BYTES_PER_MB * 1024:  # GB
-        return f"{bytes_value / (BYTES_PER_MB * 1024):.2f} GB"
+    if bytes_value >= BYTES_PER_GB:
+        return f"{bytes_value / BYTES_PER_GB:.2f} GB"
     elif bytes_value >= BYTES_PER_MB:  # MB
         return f"{bytes_value / BYTES_PER_MB:.1f} MB"
     elif bytes_value >= BYTES_PER_KB:  # KB
@@ -274,100 +438,233 @@ def format_bytes(bytes_value):
 
 def format_uptime(uptime_seconds):
     """Format uptime in seconds to human readable format."""
-    hours = uptime_seconds // SECONDS_PER_HOUR
-    minutes = (uptime_seconds % SECONDS_PER_HOUR) // SECONDS_PER_MINUTE
-    seconds = uptime_seconds % SECONDS_PER_MINUTE
+    hours, remainder = divmod(uptime_seconds, SECONDS_PER_HOUR)
+    minutes, seconds = divmod(remainder, SECONDS_PER_MINUTE)
     return f"{hours}h {minutes}m {seconds}s"
 
-def get_network_metrics():
-    """Get network metrics including throughput calculation."""
+# Network throughput state shared across requests; the lock keeps
+# concurrent WSGI workers from double-counting deltas. Only the two
+# counters we diff are kept, not the whole psutil namedtuple.
+_net_lock = threading.Lock()
+
+def _new_net_state():
+    """Return a fresh network throughput state dict."""
+    return {
+        'bytes_sent': None,
+        'bytes_recv': None,
+        'prev_time': 0.0,
+        'sent_bucket': -1,
+        'recv_bucket': -1,
+        'sent_human': '',
+        'recv_human': ''
+    }
+
+_net_state = _new_net_state()
+
+def get_network_metrics(state=None):
+    """Get network metrics including throughput calculation.
+
+    ``state`` holds the previous counter readings; it defaults to the
+    module-level dict shared across requests. Tests can pass their own
+    dict (from _new_net_state()) to stay isolated from global state.
+    """
+    if state is None:
+        state = _net_state
     net_io = psutil.net_io_counters()
     current_time = time.time()
-    
-    # Calculate network throughput if we have previous values
-    if not hasattr(get_network_metrics, 'prev_net_io'):
-        get_network_metrics.prev_net_io = net_io
-        get_network_metrics.prev_time = current_time
-        sent_speed = 0
-        recv_speed = 0
-    else:
-        time_diff = current_time - get_network_metrics.prev_time
-        if time_diff > 0:
-            sent_speed = (net_io.bytes_sent - get_network_metrics.prev_net_io.bytes_sent) / time_diff
-            recv_speed = (net_io.bytes_recv - get_network_metrics.prev_net_io.bytes_recv) / time_diff
-        else:
+
+    with _net_lock:
+        # Calculate network throughput if we have previous values
+        if state['bytes_sent'] is None:
             sent_speed = 0
             recv_speed = 0
-        
-        get_network_metrics.prev_net_io = net_io
-        get_network_metrics.prev_time = current_time
-    
+        else:
+            time_diff = current_time - state['prev_time']
+            if time_diff > 0:
+                # psutil.net_io_counters() defaults to nowrap=True, so the
+                # counters never go backwards even when the kernel's 32-bit
+                # counters wrap; the clamp just guards against a state dict
+                # seeded with newer readings than the current ones
+                sent_speed = max(0, net_io.bytes_sent - state['bytes_sent']) / time_diff
+                recv_speed = max(0, net_io.bytes_recv - state['bytes_recv']) / time_diff
+            else:
+                sent_speed = 0
+                recv_speed = 0
+
+        state['bytes_sent'] = net_io.bytes_sent
+        state['bytes_recv'] = net_io.bytes_recv
+        state['prev_time'] = current_time
+
+        # Re-render the human-readable totals only when their MB bucket moves
+        sent_bucket = net_io.bytes_sent // BYTES_PER_MB
+        if sent_bucket != state['sent_bucket']:
+            state['sent_bucket'] = sent_bucket
+            state['sent_human'] = format_bytes(net_io.bytes_sent)
+        recv_bucket = net_io.bytes_recv // BYTES_PER_MB
+        if recv_bucket != state['recv_bucket']:
+            state['recv_bucket'] = recv_bucket
+            state['recv_human'] = format_bytes(net_io.bytes_recv)
+
+        bytes_sent_human = state['sent_human']
+        bytes_recv_human = state['recv_human']
+
     return {
         'bytes_sent': net_io.bytes_sent,
         'bytes_recv': net_io.bytes_recv,
-        'bytes_sent_human': format_bytes(net_io.bytes_sent),
-        'bytes_recv_human': format_bytes(net_io.bytes_recv),
+        'bytes_sent_human': bytes_sent_human,
+        'bytes_recv_human': bytes_recv_human,
         'sent_speed': sent_speed,
         'recv_speed': recv_speed,
         'sent_speed_human': f"{sent_speed / BYTES_PER_KB:.1f} KB/s",
         'recv_speed_human': f"{recv_speed / BYTES_PER_KB:.1f} KB/s"
     }
 
+# Persistent pool for the independent metric probes so their waits overlap
+_EXECUTOR = ThreadPoolExecutor(max_workers=3)
+
+# Boot time is constant for the process lifetime; disk usage changes
+# slowly enough to re-stat at a multi-second cadence
+_BOOT_TIME = psutil.boot_time()
+_disk_cache = {'ts': 0.0, 'percent': 0.0}
+
+def _cpu_percent_sampler():
+    """Periodically reset the cpu_percent delta window.
+
+    psutil.cpu_percent(interval=None) reports usage since the previous
+    call; sampling at a fixed cadence keeps that window bounded so request
+    handlers get a fresh reading without sleeping inside the request.
+    """
+    while True:
+        time.sleep(CPU_SAMPLE_INTERVAL)
+        psutil.cpu_percent(interval=None)
+
 def get_system_metrics():
     """Collect and return system metrics including CPU, memory, disk, and GPU usage."""
-    # CPU metrics
-    cpu_percent = psutil.cpu_percent(interval=1)
-    
-    # Memory metrics
+    # Kick off the independent probes concurrently; the local psutil reads
+    # below run while they are in flight
+    gpu_future = _EXECUTOR.submit(get_gpu_metrics)
+    thermal_future = _EXECUTOR.submit(get_thermal_throttling_status)
+
+    # CPU metrics (non-blocking; the background sampler keeps the delta fresh)
+    cpu_percent = psutil.cpu_percent(interval=None)
+    cpu_cores = get_cpu_core_metrics()
+
+    # Memory metrics; fetched once and shared with the pressure calculation
     memory = psutil.virtual_memory()
+    swap = psutil.swap_memory()
     memory_percent = memory.percent
-    
-    # Get memory pressure metrics
-    memory_pressure_metrics = get_memory_pressure_metrics()
-    
-    # Get thermal throttling status
-    thermal_status = get_thermal_throttling_status()
-    
-    # Disk metrics
-    disk = psutil.disk_usage('/')
-    disk_percent = disk.percent
+    memory_pressure_metrics = get_memory_pressure_metrics(memory, swap)
+
+    # Disk metrics (cached between requests)
+    now = time.monotonic()
+    if now - _disk_cache['ts'] > DISK_CACHE_TTL:
+        _disk_cache['percent'] = psutil.disk_usage('/').percent
+        _disk_cache['ts'] = now
+    disk_percent = _disk_cache['percent']
     
     # Network metrics
     network_metrics = get_network_metrics()
     
     # Uptime
-    uptime_seconds = int(time.time() - psutil.boot_time())
+    uptime_seconds = int(time.time() - _BOOT_TIME)
     uptime_str = format_uptime(uptime_seconds)
     
-    # GPU metrics
-    gpu_metrics = get_gpu_metrics()
-    
+    # Gather the concurrent probe results
+    thermal_status = thermal_future.result()
+    gpu_metrics = gpu_future.result()
+
     return {
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
         'cpu_percent': cpu_percent,
+        'cpu_cores': cpu_cores,
         'memory_percent': memory_percent,
         'disk_percent': disk_percent,
         'uptime': uptime_str,
         'network': network_metrics,
         'gpu_metrics': gpu_metrics,
-        'platform': {
-            'system': platform.system(),
-            'machine': platform.machine(),
-            'is_jetson': is_jetson()
-        },
+        'platform': _PLATFORM_INFO,
         'memory_pressure': memory_pressure_metrics,
         'thermal_status': thermal_status
     }
 
+# The dashboard template takes no request-scoped context, so one render
+# serves every page load
+_index_cache = None
+
 @app.route('/')
 def index():
-    """Render the main dashboard page."""
-    return render_template('index.html')
+    """Serve the main dashboard page, rendered once and cached as bytes."""
+    global _index_cache
+    if _index_cache is None:
+        _index_cache = render_template('index.html').encode('utf-8')
+    return app.response_class(_index_cache, mimetype='text/html')
+
+# Cache of the serialized /metrics payload shared by all pollers
+_metrics_cache = {'ts': 0.0, 'body': None, 'etag': None}
+_metrics_cache_lock = threading.Lock()
+
+def _refresh_metrics_cache():
+    """Reserialize the metrics payload once its TTL has expired.
+
+    Returns the current (body, etag) pair, read under the lock so a
+    concurrent refresh can never pair one refresh's body with another
+    refresh's ETag.
+    """
+    if time.monotonic() - _metrics_cache['ts'] >= METRICS_CACHE_TTL:
+        with _metrics_cache_lock:
+            if time.monotonic() - _metrics_cache['ts'] >= METRICS_CACHE_TTL:
+                body = orjson.dumps(get_system_metrics())
+                _metrics_cache['body'] = body
+                _metrics_cache['etag'] = hashlib.blake2b(body, digest_size=8).hexdigest()
+                _metrics_cache['ts'] = time.monotonic()
+    with _metrics_cache_lock:
+        return _metrics_cache['body'], _metrics_cache['etag']
 
 @app.route('/metrics')
 def metrics():
-    """Return system metrics as JSON response."""
-    return jsonify(get_system_metrics())
+    """Return system metrics as JSON, cached for METRICS_CACHE_TTL seconds.
+
+    Multiple dashboard tabs polling at ~1 Hz share one probe sweep and one
+    serialization instead of each paying for their own. Clients sending
+    If-None-Match get a body-less 304 while the payload is unchanged.
+    """
+    body, etag = _refresh_metrics_cache()
+
+    if request.headers.get('If-None-Match') == etag:
+        return app.response_class(status=304, headers={'ETag': etag})
+    return app.response_class(body, mimetype='application/json',
+                              headers={'ETag': etag, 'Cache-Control': 'max-age=0'})
+
+@app.route('/metrics/stream')
+def metrics_stream():
+    """Stream metrics as Server-Sent Events at the sampling cadence.
+
+    Pushing from the server lets it sample at its own refresh rate instead
+    of the fastest polling client; a comment heartbeat keeps proxies from
+    dropping the idle connection.
+    """
+    def generate():
+        next_heartbeat = time.monotonic() + SSE_HEARTBEAT_INTERVAL
+        while True:
+            body, _ = _refresh_metrics_cache()
+            yield b'data: ' + body + b'\n\n'
+            if time.monotonic() >= next_heartbeat:
+                yield b': ping\n\n'
+                next_heartbeat = time.monotonic() + SSE_HEARTBEAT_INTERVAL
+            time.sleep(SSE_PUSH_INTERVAL)
+
+    return app.response_class(generate(), mimetype='text/event-stream')
+
+# Start the background tegrastats reader once per process
+if is_jetson():
+    start_tegrastats_reader()
+
+# Prime the non-blocking cpu_percent counter and keep it sampled
+psutil.cpu_percent(interval=None)
+threading.Thread(target=_cpu_percent_sampler, daemon=True).start()
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5005, debug=True) 
\ No newline at end of file
+    # Development server only; run under gunicorn in production (see README).
+    # threaded=True lets the dev server overlap requests as a fallback.
+    app.run(host='0.0.0.0', port=5005, threaded=True,
+            debug=os.environ.get('FLASK_DEBUG') == '1') 
\ No newline at end of file
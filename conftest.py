@@ -0,0 +1,12 @@
+"""Pytest configuration: make the project root importable.
+
+pytest imports this file exactly once per session, so the path insertion
+replaces the per-file sys.path hacks the test modules used to carry.
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
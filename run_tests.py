@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Test runner for jetson-monitor."""
+"""unittest-based runner for the jetson-monitor unit tests.
+
+The integration tests are pytest-native (fixtures, parametrize) and are
+not discovered by unittest; run ``pytest`` for the full suite.
+"""
 
 import sys
 import os
@@ -329,7 +329,7 @@ function updateCharts(data) {
     networkChart.update('none');
 }
 
-// Fetch and update metrics
+// Fetch and update metrics (polling fallback)
 function updateMetrics() {
     fetch('/metrics')
         .then(response => response.json())
@@ -340,19 +340,44 @@ function updateMetrics() {
         .catch(error => console.error('Error fetching metrics:', error));
 }
 
+// Stream metrics from the server instead of polling
+let lastChartUpdate = 0;
+function startStream() {
+    const source = new EventSource('/metrics/stream');
+    source.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        updateMetricsDisplay(data);
+        // Charts advance at the user-selected interval; the readouts
+        // update on every server push
+        const now = Date.now();
+        if (now - lastChartUpdate >= updateIntervalMs) {
+            updateCharts(data);
+            lastChartUpdate = now;
+        }
+    };
+    // EventSource reconnects automatically on error; nothing to do here
+    return source;
+}
+
 // Update interval handler
 function updateInterval() {
     const newInterval = document.getElementById('updateInterval').value;
     updateIntervalMs = newInterval * 1000;
-    clearInterval(intervalId);
-    intervalId = setInterval(updateMetrics, updateIntervalMs);
+    if (intervalId) {
+        clearInterval(intervalId);
+        intervalId = setInterval(updateMetrics, updateIntervalMs);
+    }
 }
 
 // Initialize the monitoring
 function init() {
     initCharts();
-    intervalId = setInterval(updateMetrics, updateIntervalMs);
-    updateMetrics(); // Initial update
+    if (window.EventSource) {
+        startStream();
+    } else {
+        intervalId = setInterval(updateMetrics, updateIntervalMs);
+        updateMetrics(); // Initial update
+    }
 }
 
 // Start monitoring when the page loads
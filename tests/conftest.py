@@ -0,0 +1,13 @@
+"""Shared pytest fixtures for the test suite."""
+
+import pytest
+
+import app
+
+
+@pytest.fixture(scope='session')
+def client():
+    """One Flask test client shared by the whole session."""
+    if not app.app.config.get('TESTING'):
+        app.app.testing = True
+    return app.app.test_client()
@@ -2,29 +2,97 @@
 """Unit tests for app.py."""
 
 import unittest
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import patch, mock_open, MagicMock, call
-import sys
-import os
 import tempfile
 import shutil
 import subprocess
+import psutil
 
-# Add the parent directory to the path so we can import app
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# The project root is put on sys.path by the top-level conftest.py
 import app
 
 
+class _FakeFile:
+    """Minimal open() stand-in for tests that only call read().
+
+    mock_open builds a full MagicMock tree per use; this is a single tiny
+    object. Use mock_open instead when a test asserts on the open() call.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def read(self):
+        return self._data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _fake_open(data):
+    """Return an open() replacement that always yields a _FakeFile."""
+    return lambda *args, **kwargs: _FakeFile(data)
+
+
 class TestApp(unittest.TestCase):
     """Test cases for the main app module."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build immutable fixtures once for the whole class.
+
+        The sample strings and psutil-style mock objects are read-only, so
+        constructing them per test just adds MagicMock setup overhead.
+        """
+        cls.JETSON_MODEL = 'NVIDIA Jetson Nano Developer Kit'
+        cls.TEGRASTATS_LINE = (
+            "RAM 2048/8192MB GR3D_FREQ 75% gpu@65C cpu@70C "
+            "VDD_IN 5000mW VDD_CPU_GPU_CV 3000mW"
+        )
+        cls.TEGRASTATS_RAM_LINE = (
+            "RAM 2048/8192MB CPU [25%@1479,50%@1479,75%@1479,100%@1479]"
+        )
+        cls.MOCK_MEMORY = MagicMock(
+            percent=60.0,
+            available=4 * 1024 * 1024 * 1024,  # 4GB
+            total=16 * 1024 * 1024 * 1024  # 16GB
+        )
+        cls.MOCK_SWAP = MagicMock(
+            percent=10.0,
+            used=1 * 1024 * 1024 * 1024,  # 1GB
+            total=4 * 1024 * 1024 * 1024,  # 4GB
+            free=3 * 1024 * 1024 * 1024  # 3GB
+        )
+        # One Werkzeug test client for every route test in the class
+        app.app.config['TESTING'] = True
+        cls.client = app.app.test_client()
+
     def setUp(self):
         """Set up test fixtures."""
-        # Reset any function attributes that might persist between tests
-        if hasattr(app.get_network_metrics, 'prev_net_io'):
-            delattr(app.get_network_metrics, 'prev_net_io')
-        if hasattr(app.get_network_metrics, 'prev_time'):
-            delattr(app.get_network_metrics, 'prev_time')
+        # Shared patch stack; cheaper than stacking @patch decorators and
+        # torn down automatically after each test
+        self.patches = ExitStack()
+        self.addCleanup(self.patches.close)
+        # Reset the tegrastats reader cache between tests
+        app._tegrastats_cache.update(line='', metrics={})
+        # Clear the cached Jetson detection result between tests
+        app.is_jetson.cache_clear()
+        # Invalidate the cached /metrics payload and index page
+        app._metrics_cache['ts'] = 0.0
+        app._index_cache = None
+        # Reset cached NVML state
+        app._nvml_init.cache_clear()
+        app._nvml_handle = None
+        # Invalidate the cached throttle status
+        app._throttle_cache.update(ts=0.0, status=None)
+        # Invalidate the cached disk usage
+        app._disk_cache.update(ts=0.0, percent=0.0)
 
     def test_constants_defined(self):
         """Test that all constants are properly defined."""
@@ -40,63 +108,43 @@ class TestApp(unittest.TestCase):
         self.assertEqual(app.SECONDS_PER_HOUR, 3600)
         self.assertEqual(app.SECONDS_PER_MINUTE, 60)
 
-    @patch('builtins.open', new_callable=mock_open, read_data='NVIDIA Jetson Nano Developer Kit')
-    def test_is_jetson_true(self, mock_file):
+    def test_is_jetson_true(self):
         """Test is_jetson() returns True for Jetson device."""
-        result = app.is_jetson()
+        with patch('builtins.open', mock_open(read_data=self.JETSON_MODEL)) as mock_file:
+            result = app.is_jetson()
         self.assertTrue(result)
         mock_file.assert_called_once_with('/proc/device-tree/model', 'r')
 
-    @patch('builtins.open', new_callable=mock_open, read_data='Intel Core i7')
-    def test_is_jetson_false(self, mock_file):
+    @patch('builtins.open', new=_fake_open('Intel Core i7'))
+    def test_is_jetson_false(self):
         """Test is_jetson() returns False for non-Jetson device."""
         result = app.is_jetson()
         self.assertFalse(result)
 
-    @patch('builtins.open', side_effect=FileNotFoundError)
-    def test_is_jetson_file_not_found(self, mock_file):
-        """Test is_jetson() handles FileNotFoundError gracefully."""
-        result = app.is_jetson()
-        self.assertFalse(result)
-
-    @patch('builtins.open', side_effect=PermissionError)
-    def test_is_jetson_permission_error(self, mock_file):
-        """Test is_jetson() handles PermissionError gracefully."""
-        result = app.is_jetson()
-        self.assertFalse(result)
-
-    def test_parse_tegrastats_value_success(self):
-        """Test parse_tegrastats_value() with valid input."""
-        stats = "RAM 2048/8192MB GR3D_FREQ 50% gpu@45C"
-        result = app.parse_tegrastats_value(stats, 'GR3D_FREQ', '%')
-        self.assertEqual(result, 50.0)
-
-    def test_parse_tegrastats_value_not_found(self):
-        """Test parse_tegrastats_value() when key not found."""
-        stats = "RAM 2048/8192MB gpu@45C"
-        result = app.parse_tegrastats_value(stats, 'GR3D_FREQ', '%')
-        self.assertIsNone(result)
-
-    def test_parse_tegrastats_value_invalid_format(self):
-        """Test parse_tegrastats_value() with invalid format."""
-        stats = "GR3D_FREQ invalid_value%"
-        result = app.parse_tegrastats_value(stats, 'GR3D_FREQ', '%')
-        self.assertIsNone(result)
-
-    @patch('app.is_jetson', return_value=True)
-    @patch('subprocess.Popen')
-    def test_get_jetson_gpu_metrics_success(self, mock_popen, mock_is_jetson):
-        """Test get_jetson_gpu_metrics() with successful tegrastats output."""
-        # Mock the subprocess
-        mock_process = MagicMock()
-        mock_process.stdout.readline.return_value = (
-            "RAM 2048/8192MB GR3D_FREQ 75% gpu@65C cpu@70C "
-            "VDD_IN 5000mW VDD_CPU_GPU_CV 3000mW"
-        )
-        mock_process.wait.return_value = 0
-        mock_popen.return_value = mock_process
+    def test_is_jetson_open_errors(self):
+        """Test is_jetson() handles open() errors gracefully."""
+        for error in (FileNotFoundError, PermissionError):
+            with self.subTest(error=error.__name__):
+                app.is_jetson.cache_clear()
+                with patch('builtins.open', side_effect=error):
+                    self.assertFalse(app.is_jetson())
+
+    def test_parse_tegrastats_value(self):
+        """Test parse_tegrastats_value() across input variants."""
+        cases = [
+            ("valid", "RAM 2048/8192MB GR3D_FREQ 50% gpu@45C", 50.0),
+            ("key not found", "RAM 2048/8192MB gpu@45C", None),
+            ("invalid format", "GR3D_FREQ invalid_value%", None),
+        ]
+        for name, stats, expected in cases:
+            with self.subTest(case=name):
+                self.assertEqual(
+                    app.parse_tegrastats_value(stats, 'GR3D_FREQ', '%'),
+                    expected)
 
-        result = app.get_jetson_gpu_metrics()
+    def test_parse_tegrastats_line_success(self):
+        """Test parse_tegrastats_line() with a full tegrastats line."""
+        result = app.parse_tegrastats_line(self.TEGRASTATS_LINE)
 
         self.assertIn('gpu_utilization', result)
         self.assertEqual(result['gpu_utilization'], 75.0)
@@ -109,18 +157,9 @@ class TestApp(unittest.TestCase):
         self.assertIn('gpu_power', result)
         self.assertEqual(result['gpu_power'], 3000.0)
 
-    @patch('app.is_jetson', return_value=True)
-    @patch('subprocess.Popen')
-    def test_get_jetson_gpu_metrics_with_ram_and_cpu(self, mock_popen, mock_is_jetson):
-        """Test get_jetson_gpu_metrics() with RAM and CPU core information."""
-        mock_process = MagicMock()
-        mock_process.stdout.readline.return_value = (
-            "RAM 2048/8192MB CPU [25%@1479,50%@1479,75%@1479,100%@1479]"
-        )
-        mock_process.wait.return_value = 0
-        mock_popen.return_value = mock_process
-
-        result = app.get_jetson_gpu_metrics()
+    def test_parse_tegrastats_line_with_ram(self):
+        """Test parse_tegrastats_line() with RAM information."""
+        result = app.parse_tegrastats_line(self.TEGRASTATS_RAM_LINE)
 
         self.assertIn('ram_used', result)
         self.assertEqual(result['ram_used'], 2048.0)
@@ -128,35 +167,64 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['ram_total'], 8192.0)
         self.assertIn('ram_percent', result)
         self.assertEqual(result['ram_percent'], 25.0)
-        self.assertIn('cpu_cores', result)
-        self.assertEqual(len(result['cpu_cores']), 4)
-        self.assertEqual(result['cpu_cores'][0]['usage'], 25.0)
-        self.assertEqual(result['cpu_cores'][0]['frequency'], 1479.0)
 
-    @patch('app.is_jetson', return_value=True)
-    @patch('subprocess.Popen', side_effect=subprocess.SubprocessError("Command not found"))
-    def test_get_jetson_gpu_metrics_subprocess_error(self, mock_popen, mock_is_jetson):
-        """Test get_jetson_gpu_metrics() handles subprocess errors."""
+    @patch('psutil.cpu_freq')
+    @patch('psutil.cpu_percent')
+    def test_get_cpu_core_metrics(self, mock_cpu, mock_freq):
+        """Test get_cpu_core_metrics() pairs usage with frequency per core."""
+        mock_cpu.return_value = [25.0, 50.0]
+        mock_freq.return_value = [MagicMock(current=1479.0), MagicMock(current=1600.0)]
+
+        result = app.get_cpu_core_metrics()
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]['usage'], 25.0)
+        self.assertEqual(result[0]['frequency'], 1479.0)
+        self.assertEqual(result[1]['usage'], 50.0)
+        self.assertEqual(result[1]['frequency'], 1600.0)
+
+    @patch('psutil.cpu_freq', return_value=None)
+    @patch('psutil.cpu_percent')
+    def test_get_cpu_core_metrics_no_freq(self, mock_cpu, mock_freq):
+        """Test get_cpu_core_metrics() when frequencies are unavailable."""
+        mock_cpu.return_value = [25.0, 50.0]
+
+        result = app.get_cpu_core_metrics()
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]['frequency'], 0.0)
+
+    def test_get_jetson_gpu_metrics_cached(self):
+        """Test get_jetson_gpu_metrics() returns a copy of the cached metrics."""
+        with patch.dict(app._tegrastats_cache, {'metrics': {'gpu_utilization': 75.0}}):
+            result = app.get_jetson_gpu_metrics()
+        self.assertEqual(result['gpu_utilization'], 75.0)
+
+    def test_get_jetson_gpu_metrics_no_data(self):
+        """Test get_jetson_gpu_metrics() when no tegrastats output is cached."""
         result = app.get_jetson_gpu_metrics()
         self.assertIn('error', result)
         self.assertEqual(result['error'], 'Failed to get GPU metrics')
 
+    @patch('app.subprocess.Popen', side_effect=subprocess.SubprocessError("Command not found"))
+    def test_start_tegrastats_reader_subprocess_error(self, mock_popen):
+        """Test start_tegrastats_reader() handles subprocess errors."""
+        app.start_tegrastats_reader()
+        self.assertIsNone(app._tegrastats_process)
+
     @patch('pynvml.nvmlInit')
     @patch('pynvml.nvmlDeviceGetHandleByIndex')
     @patch('pynvml.nvmlDeviceGetMemoryInfo')
     @patch('pynvml.nvmlDeviceGetUtilizationRates')
     def test_get_nvidia_gpu_metrics_success(self, mock_util, mock_mem, mock_handle, mock_init):
         """Test get_nvidia_gpu_metrics() with successful NVML calls."""
-        # Mock memory info
-        mock_mem_info = MagicMock()
-        mock_mem_info.used = 1024 * 1024 * 1024  # 1GB
-        mock_mem_info.total = 4 * 1024 * 1024 * 1024  # 4GB
-        mock_mem.return_value = mock_mem_info
-
-        # Mock utilization
-        mock_util_info = MagicMock()
-        mock_util_info.gpu = 75
-        mock_util.return_value = mock_util_info
+        # SimpleNamespace is enough for read-only attribute bags and far
+        # cheaper to build than a MagicMock tree
+        mock_mem.return_value = SimpleNamespace(
+            used=1024 * 1024 * 1024,  # 1GB
+            total=4 * 1024 * 1024 * 1024  # 4GB
+        )
+        mock_util.return_value = SimpleNamespace(gpu=75)
 
         result = app.get_nvidia_gpu_metrics()
 
@@ -202,20 +270,9 @@ class TestApp(unittest.TestCase):
 
     def test_calculate_memory_pressure_normal(self):
         """Test calculate_memory_pressure() with normal memory usage."""
-        mock_memory = MagicMock()
-        mock_memory.percent = 60.0
-        mock_memory.available = 4 * 1024 * 1024 * 1024  # 4GB
-        mock_memory.total = 16 * 1024 * 1024 * 1024  # 16GB
-
-        mock_swap = MagicMock()
-        mock_swap.percent = 10.0
-
-        result = app.calculate_memory_pressure(mock_memory, mock_swap)
+        result = app.calculate_memory_pressure(self.MOCK_MEMORY, self.MOCK_SWAP)
         
-        # Expected: 60*0.7 + 10*0.2 + (100-75)*0.1 = 42 + 2 + 2.5 = 46.5
-        # But with available memory calculation: (100-75)*0.1 = 2.5
-        # So total should be 42 + 2 + 2.5 = 46.5
-        # Let's check the actual calculation more carefully
+        # Expected: 60*0.7 + 10*0.2 + (100-25)*0.1 = 42 + 2 + 7.5 = 51.5
         expected = 60.0 * 0.7 + 10.0 * 0.2 + (100 - (4/16*100)) * 0.1
         self.assertAlmostEqual(result, expected, places=1)
 
@@ -254,20 +311,8 @@ class TestApp(unittest.TestCase):
     @patch('psutil.swap_memory')
     def test_get_memory_pressure_metrics_success(self, mock_swap, mock_memory):
         """Test get_memory_pressure_metrics() with successful psutil calls."""
-        # Mock memory
-        mock_mem = MagicMock()
-        mock_mem.percent = 60.0
-        mock_mem.available = 4 * 1024 * 1024 * 1024  # 4GB
-        mock_mem.total = 16 * 1024 * 1024 * 1024  # 16GB
-        mock_memory.return_value = mock_mem
-
-        # Mock swap
-        mock_swap_mem = MagicMock()
-        mock_swap_mem.percent = 10.0
-        mock_swap_mem.used = 1 * 1024 * 1024 * 1024  # 1GB
-        mock_swap_mem.total = 4 * 1024 * 1024 * 1024  # 4GB
-        mock_swap_mem.free = 3 * 1024 * 1024 * 1024  # 3GB
-        mock_swap.return_value = mock_swap_mem
+        mock_memory.return_value = self.MOCK_MEMORY
+        mock_swap.return_value = self.MOCK_SWAP
 
         result = app.get_memory_pressure_metrics()
 
@@ -278,7 +323,7 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['swap']['total'], 4096.0)  # 4GB in MB
         self.assertEqual(result['memory']['available'], 4096.0)  # 4GB in MB
 
-    @patch('psutil.virtual_memory', side_effect=Exception("psutil error"))
+    @patch('psutil.virtual_memory', side_effect=psutil.Error("psutil error"))
     def test_get_memory_pressure_metrics_error(self, mock_memory):
         """Test get_memory_pressure_metrics() handles exceptions."""
         result = app.get_memory_pressure_metrics()
@@ -287,14 +332,9 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['memory']['available'], 0)
 
     @patch('app.is_jetson', return_value=True)
-    @patch('subprocess.Popen')
-    def test_get_thermal_throttling_status_jetson_normal(self, mock_popen, mock_is_jetson):
+    @patch('app.get_latest_tegrastats', return_value="Normal operation")
+    def test_get_thermal_throttling_status_jetson_normal(self, mock_latest, mock_is_jetson):
         """Test get_thermal_throttling_status() on Jetson with normal status."""
-        mock_process = MagicMock()
-        mock_process.stdout.readline.return_value = "Normal operation"
-        mock_process.wait.return_value = 0
-        mock_popen.return_value = mock_process
-
         result = app.get_thermal_throttling_status()
 
         self.assertFalse(result['cpu_throttled'])
@@ -302,14 +342,9 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['status'], 'Normal')
 
     @patch('app.is_jetson', return_value=True)
-    @patch('subprocess.Popen')
-    def test_get_thermal_throttling_status_jetson_throttled(self, mock_popen, mock_is_jetson):
+    @patch('app.get_latest_tegrastats', return_value="CPU_THROTTLE GPU_THROTTLE")
+    def test_get_thermal_throttling_status_jetson_throttled(self, mock_latest, mock_is_jetson):
         """Test get_thermal_throttling_status() on Jetson with throttling."""
-        mock_process = MagicMock()
-        mock_process.stdout.readline.return_value = "CPU_THROTTLE GPU_THROTTLE"
-        mock_process.wait.return_value = 0
-        mock_popen.return_value = mock_process
-
         result = app.get_thermal_throttling_status()
 
         self.assertTrue(result['cpu_throttled'])
@@ -317,8 +352,8 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['status'], 'Throttled')
 
     @patch('app.is_jetson', return_value=False)
-    @patch('builtins.open', new_callable=mock_open, read_data='5')
-    def test_get_thermal_throttling_status_non_jetson_throttled(self, mock_file, mock_is_jetson):
+    @patch('builtins.open', new=_fake_open('5'))
+    def test_get_thermal_throttling_status_non_jetson_throttled(self, mock_is_jetson):
         """Test get_thermal_throttling_status() on non-Jetson with throttling."""
         result = app.get_thermal_throttling_status()
 
@@ -327,8 +362,8 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['status'], 'Throttled')
 
     @patch('app.is_jetson', return_value=False)
-    @patch('builtins.open', new_callable=mock_open, read_data='0')
-    def test_get_thermal_throttling_status_non_jetson_normal(self, mock_file, mock_is_jetson):
+    @patch('builtins.open', new=_fake_open('0'))
+    def test_get_thermal_throttling_status_non_jetson_normal(self, mock_is_jetson):
         """Test get_thermal_throttling_status() on non-Jetson with normal status."""
         result = app.get_thermal_throttling_status()
 
@@ -348,90 +383,89 @@ class TestApp(unittest.TestCase):
 
     def test_format_bytes(self):
         """Test format_bytes() with various byte values."""
-        self.assertEqual(app.format_bytes(512), "512 B")
-        self.assertEqual(app.format_bytes(1024), "1.0 KB")
-        self.assertEqual(app.format_bytes(1024 * 1024), "1.0 MB")
-        self.assertEqual(app.format_bytes(1024 * 1024 * 1024), "1.00 GB")
-        self.assertEqual(app.format_bytes(1536 * 1024), "1.5 MB")
+        cases = [
+            (512, "512 B"),
+            (1024, "1.0 KB"),
+            (1024 * 1024, "1.0 MB"),
+            (1024 * 1024 * 1024, "1.00 GB"),
+            (1536 * 1024, "1.5 MB"),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(app.format_bytes(value), expected)
 
     def test_format_uptime(self):
         """Test format_uptime() with various time values."""
-        self.assertEqual(app.format_uptime(3661), "1h 1m 1s")
-        self.assertEqual(app.format_uptime(3600), "1h 0m 0s")
-        self.assertEqual(app.format_uptime(61), "0h 1m 1s")
-        self.assertEqual(app.format_uptime(30), "0h 0m 30s")
+        cases = [
+            (3661, "1h 1m 1s"),
+            (3600, "1h 0m 0s"),
+            (61, "0h 1m 1s"),
+            (30, "0h 0m 30s"),
+        ]
+        for seconds, expected in cases:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(app.format_uptime(seconds), expected)
 
     @patch('psutil.net_io_counters')
     def test_get_network_metrics_first_call(self, mock_net_io):
         """Test get_network_metrics() on first call."""
-        mock_io = MagicMock()
-        mock_io.bytes_sent = 1000
-        mock_io.bytes_recv = 2000
-        mock_net_io.return_value = mock_io
+        mock_net_io.return_value = SimpleNamespace(bytes_sent=1000, bytes_recv=2000)
 
-        result = app.get_network_metrics()
+        result = app.get_network_metrics(state=app._new_net_state())
 
         self.assertEqual(result['bytes_sent'], 1000)
         self.assertEqual(result['bytes_recv'], 2000)
         self.assertEqual(result['sent_speed'], 0)
         self.assertEqual(result['recv_speed'], 0)
 
-    @patch('psutil.net_io_counters')
-    @patch('time.time')
-    def test_get_network_metrics_with_speed_calculation(self, mock_time, mock_net_io):
+    def test_get_network_metrics_with_speed_calculation(self):
         """Test get_network_metrics() with speed calculation."""
-        # First call
-        mock_io1 = MagicMock()
-        mock_io1.bytes_sent = 1000
-        mock_io1.bytes_recv = 2000
-        
-        # Second call
-        mock_io2 = MagicMock()
-        mock_io2.bytes_sent = 2000  # 1000 bytes more
-        mock_io2.bytes_recv = 4000  # 2000 bytes more
-        
-        mock_net_io.side_effect = [mock_io1, mock_io2]
-        mock_time.side_effect = [1000, 1002]  # 2 seconds difference
+        # Swap the module attributes directly instead of going through
+        # patch(); each call is then a plain next() rather than MagicMock
+        # side_effect dispatch
+        counters = iter([
+            MagicMock(bytes_sent=1000, bytes_recv=2000),
+            MagicMock(bytes_sent=2000, bytes_recv=4000),  # +1000/+2000 bytes
+        ])
+        times = iter([1000, 1002])  # 2 seconds difference
+        orig_time, orig_net = app.time.time, app.psutil.net_io_counters
+        app.time.time = lambda: next(times)
+        app.psutil.net_io_counters = lambda: next(counters)
+        self.addCleanup(setattr, app.time, 'time', orig_time)
+        self.addCleanup(setattr, app.psutil, 'net_io_counters', orig_net)
+
+        state = app._new_net_state()
 
         # First call
-        result1 = app.get_network_metrics()
+        result1 = app.get_network_metrics(state=state)
         self.assertEqual(result1['sent_speed'], 0)
         self.assertEqual(result1['recv_speed'], 0)
 
         # Second call
-        result2 = app.get_network_metrics()
+        result2 = app.get_network_metrics(state=state)
         self.assertEqual(result2['sent_speed'], 500)  # 1000 bytes / 2 seconds
         self.assertEqual(result2['recv_speed'], 1000)  # 2000 bytes / 2 seconds
 
-    @patch('psutil.cpu_percent')
-    @patch('psutil.virtual_memory')
-    @patch('psutil.disk_usage')
-    @patch('psutil.boot_time')
-    @patch('time.time')
-    @patch('app.get_memory_pressure_metrics')
-    @patch('app.get_thermal_throttling_status')
-    @patch('app.get_network_metrics')
-    @patch('app.get_gpu_metrics')
-    @patch('platform.system')
-    @patch('platform.machine')
-    @patch('app.is_jetson')
-    def test_get_system_metrics(self, mock_is_jetson, mock_machine, mock_system,
-                               mock_gpu, mock_network, mock_thermal, mock_memory_pressure,
-                               mock_time, mock_boot, mock_disk, mock_memory, mock_cpu):
+    def test_get_system_metrics(self):
         """Test get_system_metrics() returns complete system information."""
-        # Mock all the dependencies
-        mock_cpu.return_value = 25.5
-        mock_memory.return_value = MagicMock(percent=60.0)
-        mock_disk.return_value = MagicMock(percent=45.0)
-        mock_boot.return_value = 1000000
-        mock_time.return_value = 1000361  # 361 seconds after boot
-        mock_memory_pressure.return_value = {'memory_pressure': 30.0}
-        mock_thermal.return_value = {'status': 'Normal'}
-        mock_network.return_value = {'bytes_sent': 1000, 'bytes_recv': 2000}
-        mock_gpu.return_value = {'gpu_utilization': 50}
-        mock_system.return_value = 'Linux'
-        mock_machine.return_value = 'x86_64'
-        mock_is_jetson.return_value = False
+        # One ExitStack instead of ten stacked @patch decorators; the
+        # patches are entered once and closed together in cleanup
+        enter = self.patches.enter_context
+        enter(patch('psutil.cpu_percent', return_value=25.5))
+        enter(patch('psutil.virtual_memory', return_value=MagicMock(percent=60.0)))
+        enter(patch('psutil.disk_usage', return_value=MagicMock(percent=45.0)))
+        enter(patch('app._BOOT_TIME', 1000000))
+        enter(patch('time.time', return_value=1000361))  # 361 seconds after boot
+        enter(patch('app.get_memory_pressure_metrics',
+                    return_value={'memory_pressure': 30.0}))
+        enter(patch('app.get_thermal_throttling_status',
+                    return_value={'status': 'Normal'}))
+        enter(patch('app.get_network_metrics',
+                    return_value={'bytes_sent': 1000, 'bytes_recv': 2000}))
+        enter(patch('app.get_gpu_metrics',
+                    return_value={'gpu_utilization': 50}))
+        enter(patch('app.get_cpu_core_metrics',
+                    return_value=[{'usage': 25.0, 'frequency': 1479.0}]))
 
         result = app.get_system_metrics()
 
@@ -449,8 +483,7 @@ class TestApp(unittest.TestCase):
         self.assertEqual(result['memory_percent'], 60.0)
         self.assertEqual(result['disk_percent'], 45.0)
         self.assertEqual(result['uptime'], '0h 6m 1s')
-        self.assertEqual(result['platform']['system'], 'Linux')
-        self.assertEqual(result['platform']['is_jetson'], False)
+        self.assertEqual(result['platform'], app._PLATFORM_INFO)
 
     def test_flask_app_creation(self):
         """Test that Flask app is created correctly."""
@@ -462,10 +495,9 @@ class TestApp(unittest.TestCase):
     def test_index_route(self, mock_render):
         """Test the index route."""
         mock_render.return_value = 'rendered_template'
-        
-        with app.app.test_client() as client:
-            response = client.get('/')
-            
+
+        response = self.client.get('/')
+
         self.assertEqual(response.status_code, 200)
         mock_render.assert_called_once_with('index.html')
 
@@ -473,10 +505,9 @@ class TestApp(unittest.TestCase):
     def test_metrics_route(self, mock_metrics):
         """Test the metrics route."""
         mock_metrics.return_value = {'cpu_percent': 25.0}
-        
-        with app.app.test_client() as client:
-            response = client.get('/metrics')
-            
+
+        response = self.client.get('/metrics')
+
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json, {'cpu_percent': 25.0})
         mock_metrics.assert_called_once()
@@ -1,230 +1,297 @@
 #!/usr/bin/env python3
 """Integration tests for the Flask application."""
 
-import unittest
-import json
-import sys
-import os
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Add the parent directory to the path so we can import app
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
+# The project root is put on sys.path by the top-level conftest.py
 import app
 
+# Lets developers run the fast unit suite alone: pytest -m "not integration"
+pytestmark = pytest.mark.integration
 
-class TestIntegration(unittest.TestCase):
-    """Integration tests for the Flask application."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        app.app.config['TESTING'] = True
-        self.client = app.app.test_client()
-
-    def test_index_route_returns_html(self):
-        """Test that the index route returns HTML content."""
-        response = self.client.get('/')
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertIn('text/html', response.content_type)
-        # Should contain some basic HTML structure
-        self.assertIn(b'<html', response.data.lower())
-        self.assertIn(b'</html>', response.data.lower())
-
-    def test_metrics_route_returns_json(self):
-        """Test that the metrics route returns valid JSON."""
-        response = self.client.get('/metrics')
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.content_type, 'application/json')
-        
-        # Parse JSON response
-        data = json.loads(response.data)
-        
-        # Check that required fields are present
-        required_fields = [
-            'timestamp', 'cpu_percent', 'memory_percent', 'disk_percent',
-            'uptime', 'network', 'gpu_metrics', 'platform', 'memory_pressure',
-            'thermal_status'
-        ]
-        
-        for field in required_fields:
-            self.assertIn(field, data, f"Missing required field: {field}")
-
-    def test_metrics_route_data_types(self):
-        """Test that metrics route returns correct data types."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        # Test numeric fields
-        self.assertIsInstance(data['cpu_percent'], (int, float))
-        self.assertIsInstance(data['memory_percent'], (int, float))
-        self.assertIsInstance(data['disk_percent'], (int, float))
-        
-        # Test string fields
-        self.assertIsInstance(data['timestamp'], str)
-        self.assertIsInstance(data['uptime'], str)
-        
-        # Test dictionary fields
-        self.assertIsInstance(data['network'], dict)
-        self.assertIsInstance(data['gpu_metrics'], dict)
-        self.assertIsInstance(data['platform'], dict)
-        self.assertIsInstance(data['memory_pressure'], dict)
-        self.assertIsInstance(data['thermal_status'], dict)
-
-    def test_metrics_route_platform_info(self):
-        """Test that platform information is correctly included."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        platform = data['platform']
-        self.assertIn('system', platform)
-        self.assertIn('machine', platform)
-        self.assertIn('is_jetson', platform)
-        self.assertIsInstance(platform['is_jetson'], bool)
-
-    def test_metrics_route_network_info(self):
-        """Test that network information is correctly included."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        network = data['network']
-        required_network_fields = [
-            'bytes_sent', 'bytes_recv', 'bytes_sent_human', 'bytes_recv_human',
-            'sent_speed', 'recv_speed', 'sent_speed_human', 'recv_speed_human'
-        ]
-        
-        for field in required_network_fields:
-            self.assertIn(field, network, f"Missing network field: {field}")
-
-    def test_metrics_route_memory_pressure_info(self):
-        """Test that memory pressure information is correctly included."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        memory_pressure = data['memory_pressure']
-        self.assertIn('memory_pressure', memory_pressure)
-        self.assertIn('swap', memory_pressure)
-        self.assertIn('memory', memory_pressure)
-        
-        # Test that memory_pressure is a numeric value
-        self.assertIsInstance(memory_pressure['memory_pressure'], (int, float))
-        self.assertGreaterEqual(memory_pressure['memory_pressure'], 0)
-        self.assertLessEqual(memory_pressure['memory_pressure'], 100)
-
-    def test_metrics_route_thermal_status(self):
-        """Test that thermal status information is correctly included."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        thermal_status = data['thermal_status']
-        self.assertIn('cpu_throttled', thermal_status)
-        self.assertIn('gpu_throttled', thermal_status)
-        self.assertIn('status', thermal_status)
-        
-        # Test that boolean fields are actually boolean
-        self.assertIsInstance(thermal_status['cpu_throttled'], bool)
-        self.assertIsInstance(thermal_status['gpu_throttled'], bool)
-        
-        # Test that status is a valid string
-        self.assertIn(thermal_status['status'], ['Normal', 'Throttled', 'Unknown', 'Error'])
-
-    def test_metrics_route_gpu_metrics(self):
-        """Test that GPU metrics are correctly included."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        gpu_metrics = data['gpu_metrics']
-        
-        # GPU metrics should either contain actual metrics or an error
-        if 'error' in gpu_metrics:
-            self.assertIsInstance(gpu_metrics['error'], str)
-        else:
-            # Should contain at least some GPU information
-            self.assertTrue(len(gpu_metrics) > 0)
-
-    def test_metrics_route_timestamp_format(self):
-        """Test that timestamp is in the expected format."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        timestamp = data['timestamp']
-        # Should be in format: YYYY-MM-DD HH:MM:SS
-        import re
-        timestamp_pattern = r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'
-        self.assertIsNotNone(re.match(timestamp_pattern, timestamp))
-
-    def test_metrics_route_uptime_format(self):
-        """Test that uptime is in the expected format."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        uptime = data['uptime']
-        # Should be in format: Xh Ym Zs
-        import re
-        uptime_pattern = r'^\d+h \d+m \d+s$'
-        self.assertIsNotNone(re.match(uptime_pattern, uptime))
-
-    def test_metrics_route_percentage_values(self):
-        """Test that percentage values are within valid ranges."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        # CPU, memory, and disk percentages should be between 0 and 100
-        self.assertGreaterEqual(data['cpu_percent'], 0)
-        self.assertLessEqual(data['cpu_percent'], 100)
-        self.assertGreaterEqual(data['memory_percent'], 0)
-        self.assertLessEqual(data['memory_percent'], 100)
-        self.assertGreaterEqual(data['disk_percent'], 0)
-        self.assertLessEqual(data['disk_percent'], 100)
-
-    def test_metrics_route_network_speed_formats(self):
-        """Test that network speed human-readable formats are correct."""
-        response = self.client.get('/metrics')
-        data = json.loads(response.data)
-        
-        network = data['network']
-        
-        # Human-readable formats should end with appropriate units
-        self.assertTrue(network['sent_speed_human'].endswith(' KB/s'))
-        self.assertTrue(network['recv_speed_human'].endswith(' KB/s'))
-        
-        # Human-readable byte formats should have appropriate units
-        self.assertTrue(any(network['bytes_sent_human'].endswith(unit) 
-                          for unit in [' B', ' KB', ' MB', ' GB']))
-        self.assertTrue(any(network['bytes_recv_human'].endswith(unit) 
-                          for unit in [' B', ' KB', ' MB', ' GB']))
-
-    def test_metrics_route_consistency(self):
-        """Test that multiple calls to metrics return consistent data structure."""
-        response1 = self.client.get('/metrics')
-        response2 = self.client.get('/metrics')
-        
-        data1 = json.loads(response1.data)
-        data2 = json.loads(response2.data)
-        
-        # Both responses should have the same structure
-        self.assertEqual(set(data1.keys()), set(data2.keys()))
-        
-        # Platform info should be consistent
-        self.assertEqual(data1['platform']['system'], data2['platform']['system'])
-        self.assertEqual(data1['platform']['machine'], data2['platform']['machine'])
-        self.assertEqual(data1['platform']['is_jetson'], data2['platform']['is_jetson'])
-
-    def test_404_route(self):
-        """Test that non-existent routes return 404."""
-        response = self.client.get('/nonexistent')
-        self.assertEqual(response.status_code, 404)
-
-    def test_metrics_route_method_not_allowed(self):
-        """Test that POST to metrics route is not allowed."""
-        response = self.client.post('/metrics')
-        self.assertEqual(response.status_code, 405)
-
-    def test_index_route_method_not_allowed(self):
-        """Test that POST to index route is not allowed."""
-        response = self.client.post('/')
-        self.assertEqual(response.status_code, 405)
-
-
-if __name__ == '__main__':
-    unittest.main()
+# Compiled once at import; the format tests only need .match()
+_TS_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')  # YYYY-MM-DD HH:MM:SS
+_UPTIME_RE = re.compile(r'^\d+h \d+m \d+s$')  # Xh Ym Zs
+# Matches an <html>...</html> document without lowercasing the whole body
+_HTML_RE = re.compile(rb'<html\b[\s\S]*</html\s*>', re.IGNORECASE)
+
+# Canned psutil readings: these tests validate the shape of /metrics, not
+# live sensor values, so there is no reason to hit real hardware per run
+_GB = 1024 * 1024 * 1024
+_CANNED_MEMORY = SimpleNamespace(percent=42.0, available=4 * _GB, total=8 * _GB)
+_CANNED_SWAP = SimpleNamespace(percent=10.0, used=1 * _GB, total=4 * _GB,
+                               free=3 * _GB)
+_CANNED_DISK = SimpleNamespace(percent=55.0)
+_CANNED_NET = SimpleNamespace(bytes_sent=10 * _GB, bytes_recv=20 * _GB)
+
+def _canned_cpu_percent(interval=None, percpu=False):
+    return [25.0, 30.0] if percpu else 27.5
+
+def _canned_cpu_freq(percpu=False):
+    freqs = [SimpleNamespace(current=1479.0), SimpleNamespace(current=1600.0)]
+    return freqs if percpu else freqs[0]
+
+# Required response fields, built once; subset checks run as a single
+# C-level set comparison instead of a per-field membership loop
+_METRICS_KEYS = frozenset({
+    'timestamp', 'cpu_percent', 'memory_percent', 'disk_percent',
+    'uptime', 'network', 'gpu_metrics', 'platform', 'memory_pressure',
+    'thermal_status'
+})
+_NETWORK_KEYS = frozenset({
+    'bytes_sent', 'bytes_recv', 'bytes_sent_human', 'bytes_recv_human',
+    'sent_speed', 'recv_speed', 'sent_speed_human', 'recv_speed_human'
+})
+_PLATFORM_KEYS = frozenset({'system', 'machine', 'is_jetson'})
+_MEMPRESSURE_KEYS = frozenset({'memory_pressure', 'swap', 'memory'})
+_THERMAL_KEYS = frozenset({'cpu_throttled', 'gpu_throttled', 'status'})
+
+# Valid thermal status strings; frozenset membership is O(1) and built once
+_THERMAL_STATES = frozenset({'Normal', 'Throttled', 'Unknown', 'Error'})
+
+# Fields that must be 0-100 percentages
+_PCT_KEYS = ('cpu_percent', 'memory_percent', 'disk_percent')
+
+# str.endswith accepts a tuple natively, checking all units in one C call
+_BYTE_UNITS = (' B', ' KB', ' MB', ' GB')
+
+# Expected type per top-level metrics field, built once at import
+_TYPE_TABLE = (
+    ('cpu_percent', (int, float)),
+    ('memory_percent', (int, float)),
+    ('disk_percent', (int, float)),
+    ('timestamp', str),
+    ('uptime', str),
+    ('network', dict),
+    ('gpu_metrics', dict),
+    ('platform', dict),
+    ('memory_pressure', dict),
+    ('thermal_status', dict),
+)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def frozen_psutil():
+    """Freeze psutil behind canned readings for the whole module."""
+    patcher = patch.multiple(
+        'psutil',
+        cpu_percent=_canned_cpu_percent,
+        cpu_freq=_canned_cpu_freq,
+        virtual_memory=lambda: _CANNED_MEMORY,
+        swap_memory=lambda: _CANNED_SWAP,
+        disk_usage=lambda path: _CANNED_DISK,
+        net_io_counters=lambda: _CANNED_NET,
+    )
+    patcher.start()
+    # Drop the cached index page in case a unit test stubbed the template,
+    # and the disk reading taken from the real system
+    app._index_cache = None
+    app._disk_cache.update(ts=0.0, percent=0.0)
+    yield
+    patcher.stop()
+
+
+@pytest.fixture(scope='module')
+def metrics_response(client, frozen_psutil):
+    """One /metrics response shared by the read-only assertions.
+
+    The TTL cache is invalidated first so no stale payload leaks in from
+    another test module.
+    """
+    app._metrics_cache['ts'] = 0.0
+    return client.get('/metrics')
+
+
+@pytest.fixture(scope='module')
+def metrics_data(metrics_response):
+    """The parsed /metrics payload; get_json memoizes the decode."""
+    return metrics_response.get_json()
+
+
+def test_index_route_returns_html(client):
+    """Test that the index route returns HTML content."""
+    response = client.get('/')
+
+    assert response.status_code == 200
+    assert 'text/html' in response.content_type
+    # Should contain some basic HTML structure
+    assert _HTML_RE.search(response.data) is not None
+
+
+def test_metrics_route_returns_json(metrics_response, metrics_data):
+    """Test that the metrics route returns valid JSON."""
+    assert metrics_response.status_code == 200
+    assert metrics_response.content_type == 'application/json'
+
+    # Check that required fields are present
+    missing = _METRICS_KEYS - metrics_data.keys()
+    assert not missing, f"Missing required fields: {missing}"
+
+
+def test_metrics_route_data_types(metrics_data):
+    """Test that metrics route returns correct data types."""
+    for field, expected_type in _TYPE_TABLE:
+        assert isinstance(metrics_data[field], expected_type), field
+
+
+def test_metrics_route_platform_info(metrics_data):
+    """Test that platform information is correctly included."""
+    platform = metrics_data['platform']
+    missing = _PLATFORM_KEYS - platform.keys()
+    assert not missing, f"Missing platform fields: {missing}"
+    assert isinstance(platform['is_jetson'], bool)
+
+
+def test_metrics_route_network_info(metrics_data):
+    """Test that network information is correctly included."""
+    network = metrics_data['network']
+    missing = _NETWORK_KEYS - network.keys()
+    assert not missing, f"Missing network fields: {missing}"
+
+
+def test_metrics_route_memory_pressure_info(metrics_data):
+    """Test that memory pressure information is correctly included."""
+    memory_pressure = metrics_data['memory_pressure']
+    missing = _MEMPRESSURE_KEYS - memory_pressure.keys()
+    assert not missing, f"Missing memory pressure fields: {missing}"
+
+    # Test that memory_pressure is a numeric value
+    assert isinstance(memory_pressure['memory_pressure'], (int, float))
+    assert 0 <= memory_pressure['memory_pressure'] <= 100
+
+
+def test_metrics_route_thermal_status(metrics_data):
+    """Test that thermal status information is correctly included."""
+    thermal_status = metrics_data['thermal_status']
+    missing = _THERMAL_KEYS - thermal_status.keys()
+    assert not missing, f"Missing thermal status fields: {missing}"
+
+    # Test that boolean fields are actually boolean
+    assert isinstance(thermal_status['cpu_throttled'], bool)
+    assert isinstance(thermal_status['gpu_throttled'], bool)
+
+    # Test that status is a valid string
+    assert thermal_status['status'] in _THERMAL_STATES
+
+
+def test_metrics_route_gpu_metrics(metrics_data):
+    """Test that GPU metrics are correctly included."""
+    gpu_metrics = metrics_data['gpu_metrics']
+
+    # GPU metrics should either contain actual metrics or an error
+    if 'error' in gpu_metrics:
+        assert isinstance(gpu_metrics['error'], str)
+    else:
+        # Should contain at least some GPU information
+        assert len(gpu_metrics) > 0
+
+
+def test_metrics_route_timestamp_format(metrics_data):
+    """Test that timestamp is in the expected format."""
+    assert _TS_RE.match(metrics_data['timestamp']) is not None
+
+
+def test_metrics_route_uptime_format(metrics_data):
+    """Test that uptime is in the expected format."""
+    assert _UPTIME_RE.match(metrics_data['uptime']) is not None
+
+
+@pytest.mark.parametrize('key', _PCT_KEYS)
+def test_metrics_route_percentage_values(metrics_data, key):
+    """Test that percentage values are within valid ranges."""
+    assert 0 <= metrics_data[key] <= 100
+
+
+def test_metrics_route_network_speed_formats(metrics_data):
+    """Test that network speed human-readable formats are correct."""
+    network = metrics_data['network']
+
+    # Human-readable formats should end with appropriate units
+    assert network['sent_speed_human'].endswith(' KB/s')
+    assert network['recv_speed_human'].endswith(' KB/s')
+
+    # Human-readable byte formats should have appropriate units
+    assert network['bytes_sent_human'].endswith(_BYTE_UNITS)
+    assert network['bytes_recv_human'].endswith(_BYTE_UNITS)
+
+
+def test_metrics_route_etag_revalidation(client):
+    """Test that /metrics honors If-None-Match with a body-less 304."""
+    response = client.get('/metrics')
+    etag = response.headers.get('ETag')
+    assert etag
+
+    revalidation = client.get('/metrics', headers={'If-None-Match': etag})
+    assert revalidation.status_code == 304
+    assert revalidation.data == b''
+    assert revalidation.headers.get('ETag') == etag
+
+
+def test_metrics_stream_first_event(client):
+    """Test that the SSE endpoint emits a metrics event straight away.
+
+    Only the first chunk is read — the generator sleeps between pushes,
+    so iterating further would stall the test. Closing the response
+    stops the stream.
+    """
+    response = client.get('/metrics/stream')
+    try:
+        assert response.status_code == 200
+        assert response.content_type.startswith('text/event-stream')
+        first_chunk = next(iter(response.response))
+        assert first_chunk.startswith(b'data: ')
+        assert first_chunk.endswith(b'\n\n')
+    finally:
+        response.close()
+
+
+def test_metrics_route_perf_budget(client):
+    """Test that repeated metrics fetches stay within a wallclock budget.
+
+    Guards the response-caching fast path: ten fetches should be served
+    from the cached body, so the budget is generous enough for slow CI
+    but fails if every request re-runs the full sweep.
+    """
+    start = time.perf_counter()
+    for _ in range(10):
+        client.get('/metrics')
+    elapsed = time.perf_counter() - start
+    assert elapsed < 1.0
+
+
+def test_metrics_route_consistency(client):
+    """Test that multiple calls to metrics return consistent data structure."""
+    response1 = client.get('/metrics')
+    response2 = client.get('/metrics')
+
+    # Byte-identical bodies (the common case, thanks to the response
+    # cache) are trivially consistent; skip the double JSON decode
+    if response1.data == response2.data:
+        return
+
+    data1 = response1.get_json()
+    data2 = response2.get_json()
+
+    # Both responses should have the same structure
+    assert set(data1.keys()) == set(data2.keys())
+
+    # Platform info should be consistent
+    assert data1['platform']['system'] == data2['platform']['system']
+    assert data1['platform']['machine'] == data2['platform']['machine']
+    assert data1['platform']['is_jetson'] == data2['platform']['is_jetson']
+
+
+@pytest.mark.parametrize('method, path, code', [
+    ('GET', '/nonexistent', 404),
+    ('POST', '/metrics', 405),
+    ('POST', '/', 405),
+])
+def test_error_status_codes(client, method, path, code):
+    """Test 404 and method-not-allowed responses."""
+    response = client.open(path, method=method)
+    assert response.status_code == code